@@ -2,20 +2,54 @@
 __init__.py for src package
 """
 
-from .config import config
-from .mcp_client import MCPClient
-from .retirement_engine import CryptoRetirementApp, TaxLot
-from .csv_parser import parse_tax_lots_csv, validate_csv_structure, format_sell_instruction
+from importlib import import_module
 
-__all__ = [
-    "config",
-    "MCPClient",
-    "CryptoRetirementApp",
-    "TaxLot",
-    "parse_tax_lots_csv",
-    "validate_csv_structure",
-    "format_sell_instruction"
-]
+# Lazy re-exports (PEP 562): the submodule import is paid on first attribute
+# access, so pulling one component (e.g. CryptoRetirementApp) doesn't import
+# heavy dependencies the others need (pandas, numpy, httpx)
+_EXPORTS = {
+    "config": ".config",
+    "MCPClient": ".mcp_client",
+    "AsyncMCPClient": ".mcp_client",
+    "CachedMCPClient": ".mcp_cache",
+    "CryptoRetirementApp": ".retirement_engine",
+    "TaxLot": ".retirement_engine",
+    "parse_tax_lots_csv": ".csv_parser",
+    "parse_and_validate": ".csv_parser",
+    "validate_csv_structure": ".csv_parser",
+    "format_sell_instruction": ".csv_parser",
+    "Portfolio": ".analyze_portfolio",
+    "Holding": ".analyze_portfolio",
+    "PortfolioAnalysis": ".analyze_portfolio",
+    "TopHolding": ".analyze_portfolio",
+    "AssetType": ".analyze_portfolio",
+    "ExitStrategy": ".exit_strategy",
+    "ExitPlan": ".exit_strategy",
+    "ExitCondition": ".exit_strategy",
+    "ExitTrigger": ".exit_strategy",
+    "ExitRecommendation": ".exit_strategy",
+    "AnalysisSnapshot": ".exit_strategy",
+    "MarketMonitor": ".market_monitor",
+    "MarketData": ".market_monitor",
+    "MarketSignal": ".market_monitor",
+    "MarketCondition": ".market_monitor"
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = "0.1.0"
-__author__ = "Crypto Retirement Team"
\ No newline at end of file
+__author__ = "Crypto Retirement Team"
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access and cache them"""
+    try:
+        module_path = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
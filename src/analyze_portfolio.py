@@ -0,0 +1,670 @@
+"""
+Portfolio Analyzer - Crypto Retirement Strategy
+Tracks crypto holdings and produces risk / diversification analysis
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:  # numba is optional; the NumPy path below is the fallback
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+class AssetType(Enum):
+    """Broad asset categories used for risk weighting"""
+    BITCOIN = 0
+    ETHEREUM = 1
+    STABLECOIN = 2
+    LAYER1 = 3
+    ALTCOIN = 4
+
+
+# Asset groupings, frozen at import: O(1) membership checks and one shared
+# object instead of per-call list literals
+_STABLECOINS = frozenset({"USDC", "USDT", "DAI"})
+
+# Symbol -> asset type for known assets; everything else is an altcoin
+_ASSET_TYPE_MAP = {
+    "BTC": AssetType.BITCOIN,
+    "ETH": AssetType.ETHEREUM,
+    "USDC": AssetType.STABLECOIN,
+    "USDT": AssetType.STABLECOIN,
+    "DAI": AssetType.STABLECOIN,
+    "SOL": AssetType.LAYER1,
+    "ADA": AssetType.LAYER1,
+    "AVAX": AssetType.LAYER1,
+    "DOT": AssetType.LAYER1
+}
+
+# Global symbol registry: every asset symbol any portfolio has seen gets
+# a stable small integer id, so hot paths can work with dense int arrays
+# instead of repeated string comparisons
+_ASSET_REGISTRY: Dict[str, int] = {}
+
+
+def _asset_id(asset: str) -> int:
+    """Intern an asset symbol, assigning the next id on first sight"""
+    asset_id = _ASSET_REGISTRY.get(asset)
+    if asset_id is None:
+        asset_id = len(_ASSET_REGISTRY)
+        _ASSET_REGISTRY[asset] = asset_id
+    return asset_id
+
+
+# Risk exposure weight per asset type, indexed by AssetType.value; the
+# per-asset weights come from one fancy-index gather over the type index.
+# Stablecoins contribute nothing, majors fully, with layer-1s and altcoins
+# slightly discounted for their smaller portfolio roles
+_RISK_BY_TYPE = np.array([1.0, 1.0, 0.0, 0.9, 0.8])
+
+
+def _analyze_core_numpy(
+    amounts: np.ndarray,
+    prices: np.ndarray,
+    costs: np.ndarray,
+    risk_weights: np.ndarray
+):
+    """Numeric core of an analysis pass
+
+    Returns (total value, total cost, max value, weighted risk exposure,
+    sum of squared values) - everything the scores need in one place.
+    The values product is computed once and reused by every reduction;
+    the dot-style reductions run through einsum with float64
+    accumulation, so float32 storage doesn't degrade the sums.
+    """
+    if amounts.size == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    values = amounts * prices
+    return (
+        float(np.einsum("i->", values, dtype=np.float64)),
+        float(np.einsum("i,i->", amounts, costs, dtype=np.float64)),
+        float(values.max()),
+        float(np.einsum("i,i->", values, risk_weights, dtype=np.float64)),
+        float(np.einsum("i,i->", values, values, dtype=np.float64))
+    )
+
+
+# Below this size the per-call threading overhead of the parallel kernel
+# outweighs the work; the fused reduction is memory-bound, so it takes
+# thousands of positions before extra cores pay off
+_PARALLEL_MIN_SIZE = 10_000
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _analyze_core_serial(amounts, prices, costs, risk_weights):  # pragma: no cover - needs numba
+        """JIT kernel: all five reductions fused into one pass"""
+        total_value = 0.0
+        total_cost = 0.0
+        largest = 0.0
+        exposure = 0.0
+        sq_sum = 0.0
+        for i in range(amounts.shape[0]):
+            v = amounts[i] * prices[i]
+            total_value += v
+            total_cost += amounts[i] * costs[i]
+            if v > largest:
+                largest = v
+            exposure += v * risk_weights[i]
+            sq_sum += v * v
+        return total_value, total_cost, largest, exposure, sq_sum
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _analyze_core_parallel(amounts, prices, costs, risk_weights):  # pragma: no cover - needs numba
+        """Thread-parallel variant of the fused kernel
+
+        prange splits the loop across cores and numba combines the
+        per-thread partial reductions; max() instead of a comparison
+        branch keeps the largest-value reduction recognizable to the
+        parallelizer.
+        """
+        total_value = 0.0
+        total_cost = 0.0
+        largest = 0.0
+        exposure = 0.0
+        sq_sum = 0.0
+        for i in prange(amounts.shape[0]):
+            v = amounts[i] * prices[i]
+            total_value += v
+            total_cost += amounts[i] * costs[i]
+            largest = max(largest, v)
+            exposure += v * risk_weights[i]
+            sq_sum += v * v
+        return total_value, total_cost, largest, exposure, sq_sum
+
+    def _analyze_core(amounts, prices, costs, risk_weights):  # pragma: no cover - needs numba
+        """Dispatch to the parallel kernel once the portfolio is large enough"""
+        if amounts.shape[0] >= _PARALLEL_MIN_SIZE:
+            return _analyze_core_parallel(amounts, prices, costs, risk_weights)
+        return _analyze_core_serial(amounts, prices, costs, risk_weights)
+else:
+    _analyze_core = _analyze_core_numpy
+
+
+@dataclass(slots=True)
+class Holding:
+    """Single portfolio position
+
+    Derived values (cost basis, current value, PnL) are plain fields
+    recomputed on mutation rather than properties, so the hot read paths
+    are slot loads instead of repeated multiplications.
+    """
+    asset: str
+    amount: float
+    avg_cost: float
+    current_price: float = 0.0
+    cost_basis: float = field(init=False)
+    current_value: float = field(init=False)
+    unrealized_pnl: float = field(init=False)
+
+    def __post_init__(self):
+        self.recompute()
+
+    def recompute(self) -> None:
+        """Refresh derived values after amount/cost/price changes"""
+        self.cost_basis = self.amount * self.avg_cost
+        self.current_value = self.amount * self.current_price
+        self.unrealized_pnl = self.current_value - self.cost_basis
+
+    @property
+    def pnl_percentage(self) -> float:
+        """Unrealized profit/loss as percent of cost"""
+        if self.cost_basis == 0:
+            return 0.0
+        return (self.unrealized_pnl / self.cost_basis) * 100
+
+
+class TopHolding(NamedTuple):
+    """One of the largest positions by current value"""
+    asset: str
+    value: float
+    pnl_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioAnalysis:
+    """Result of a portfolio analysis pass
+
+    Frozen output value: analyses are memoized and handed to consumers,
+    so immutability keeps the cached instance safe to share, and with
+    tuple-only sequence fields instances are hashable for downstream
+    dedup/caching. The PnL fields derive from the totals once at
+    construction, so the exit checks that read them every tick get
+    plain slot loads.
+    """
+    total_value: float = 0.0
+    total_cost: float = 0.0
+    risk_score: float = 0.0
+    diversification_score: float = 0.0
+    top_holdings: Tuple[TopHolding, ...] = ()
+    recommendations: Tuple[str, ...] = ()
+    unrealized_pnl: float = field(init=False)
+    pnl_percentage: float = field(init=False)
+
+    def __post_init__(self):
+        unrealized_pnl = self.total_value - self.total_cost
+        object.__setattr__(self, "unrealized_pnl", unrealized_pnl)
+        object.__setattr__(
+            self,
+            "pnl_percentage",
+            (unrealized_pnl / self.total_cost) * 100 if self.total_cost else 0.0
+        )
+
+
+class _HoldingView:
+    """
+    Lazy sequence over a portfolio's positions
+
+    Indexing materializes one Holding snapshot at a time, so callers that
+    touch a few positions (holdings[:3], holdings[0]) don't pay for
+    building an object per position in the portfolio.
+    """
+
+    __slots__ = ("_portfolio",)
+
+    def __init__(self, portfolio: "Portfolio"):
+        self._portfolio = portfolio
+
+    def __len__(self) -> int:
+        return self._portfolio._assets.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        p = self._portfolio
+        return Holding(
+            p._assets[index],
+            float(p._amounts[index]),
+            float(p._costs[index]),
+            float(p._prices[index])
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class Portfolio:
+    """
+    Crypto portfolio tracker
+    Holds positions and computes value, risk and diversification metrics
+    """
+
+    def __init__(self, holdings_data=None):
+        """
+        Initialize portfolio
+
+        Args:
+            holdings_data: Optional holdings as a list of dicts with
+                asset, amount, avg_cost, current_price keys, or a pandas
+                DataFrame with those columns
+        """
+        # Parallel arrays are the primary storage: analysis and price
+        # updates run as vectorized NumPy operations, and Holding objects
+        # are materialized only when callers ask for them. float32 is
+        # ample for amounts and per-unit prices (<8 significant digits)
+        # and halves the footprint and memory traffic
+        if isinstance(holdings_data, pd.DataFrame):
+            # Column-wise conversion: each DataFrame column becomes one
+            # array without a per-row Python loop
+            df = holdings_data
+            n = len(df)
+            self._assets = (
+                df["asset"].to_numpy(dtype=object) if "asset" in df.columns
+                else np.full(n, "BTC", dtype=object)
+            )
+            self._amounts = (
+                df["amount"].to_numpy(dtype=np.float32) if "amount" in df.columns
+                else np.zeros(n, dtype=np.float32)
+            )
+            self._costs = (
+                df["avg_cost"].to_numpy(dtype=np.float32) if "avg_cost" in df.columns
+                else np.zeros(n, dtype=np.float32)
+            )
+            self._prices = (
+                df["current_price"].to_numpy(dtype=np.float32)
+                if "current_price" in df.columns else self._costs.copy()
+            )
+        else:
+            rows = holdings_data or []
+            self._assets = np.array(
+                [row.get("asset", "BTC") for row in rows], dtype=object
+            )
+            self._amounts = np.array(
+                [float(row.get("amount", 0)) for row in rows], dtype=np.float32
+            )
+            self._costs = np.array(
+                [float(row.get("avg_cost", 0)) for row in rows], dtype=np.float32
+            )
+            self._prices = np.array(
+                [float(row.get("current_price", row.get("avg_cost", 0))) for row in rows],
+                dtype=np.float32
+            )
+        self._refresh_masks()
+        # Totals cached across analyze/__repr__ calls between mutations
+        self._total_value: Optional[float] = None
+        self._total_cost: Optional[float] = None
+        # Mutation counter: a full analysis is memoized against the version
+        # it was computed from, so repeated analyze() calls between ticks
+        # return the same object without recomputing
+        self._version = 0
+        self._cached_analysis: Optional[PortfolioAnalysis] = None
+        self._analysis_version = -1
+
+    def _refresh_masks(self) -> None:
+        """Recompute asset-dependent masks after the asset mix changes
+
+        These only change with the asset mix, not with prices. The type
+        index maps each symbol to its AssetType once; the per-asset risk
+        weights are then a dense-table gather rather than set membership
+        checks per score.
+        """
+        self._type_idx = np.fromiter(
+            (
+                _ASSET_TYPE_MAP.get(asset, AssetType.ALTCOIN).value
+                for asset in self._assets
+            ),
+            dtype=np.intp,
+            count=self._assets.size
+        )
+        self._risk_weights = _RISK_BY_TYPE[self._type_idx]
+        self._stable_mask = np.isin(self._assets, list(_STABLECOINS))
+        self._asset_ids = np.fromiter(
+            (_asset_id(asset) for asset in self._assets),
+            dtype=np.intp,
+            count=self._assets.size
+        )
+        # The cached price-tick permutation keys off the asset mix, so a
+        # changed mix invalidates it
+        self._last_keys: Optional[tuple] = None
+        self._last_dst = self._last_src = None
+
+    def _updated(self) -> None:
+        """Invalidate derived caches after a mutation"""
+        self._total_value = None
+        self._total_cost = None
+        self._version += 1
+
+    @property
+    def holdings(self) -> _HoldingView:
+        """Lazy view of the positions as Holding snapshots
+
+        Objects materialize on access: mutate the portfolio through
+        add_holding/update_prices, not through these.
+        """
+        return _HoldingView(self)
+
+    def add_holding(self, holding: Holding) -> None:
+        """Add a position to the portfolio"""
+        self._assets = np.append(self._assets, holding.asset)
+        self._amounts = np.append(self._amounts, np.float32(holding.amount))
+        self._costs = np.append(self._costs, np.float32(holding.avg_cost))
+        self._prices = np.append(self._prices, np.float32(holding.current_price))
+        self._refresh_masks()
+        self._updated()
+
+    def update_prices(self, prices: Dict[str, float]) -> None:
+        """
+        Update current prices from a {asset: price} dict
+
+        Backtest and rebalance loops feed the same keys in the same
+        order every tick, so the position/quote index pairs resolved for
+        one key order are cached; a repeat tick skips the symbol
+        resolution entirely and applies the quotes with one fancy-indexed
+        copy. A new key order falls back to the dense lookup table
+        indexed by interned asset id and recaches.
+
+        Args:
+            prices: Latest market prices keyed by asset symbol
+        """
+        keys = tuple(prices.keys())
+        if keys == self._last_keys:
+            quotes = np.fromiter(prices.values(), dtype=np.float32, count=len(keys))
+            self._prices[self._last_dst] = quotes[self._last_src]
+            self._updated()
+            return
+
+        # Slow path: scatter each quote's position in the tick into the
+        # id-indexed table, gather per position, keep the matched pairs
+        idx_lut = np.full(len(_ASSET_REGISTRY), -1, dtype=np.intp)
+        for position, asset in enumerate(keys):
+            asset_id = _ASSET_REGISTRY.get(asset)
+            if asset_id is not None:
+                idx_lut[asset_id] = position
+        src = idx_lut[self._asset_ids]
+        dst = np.nonzero(src >= 0)[0]
+        self._last_keys = keys
+        self._last_dst = dst
+        self._last_src = src[dst]
+
+        if dst.size:
+            quotes = np.fromiter(prices.values(), dtype=np.float32, count=len(keys))
+            self._prices[dst] = quotes[self._last_src]
+        self._updated()
+
+    def values_by_type(self) -> np.ndarray:
+        """Current market value aggregated per AssetType
+
+        A single weighted bincount over the type index sums every type
+        in one pass - no boolean-mask sum per type. Returns one total
+        per AssetType, 0.0 for types not held.
+
+        Returns:
+            Array of per-type value totals indexed by AssetType.value
+        """
+        return np.bincount(
+            self._type_idx,
+            weights=self._amounts * self._prices,
+            minlength=len(AssetType)
+        )
+
+    def pnl_percentages(self) -> np.ndarray:
+        """Per-position unrealized PnL as percent of cost, vectorized
+
+        Branchless counterpart of Holding.pnl_percentage: positions with a
+        zero cost basis (zero amount or zero per-unit cost) report 0.0.
+        The inner where substitutes a safe divisor so the division never
+        traps, the outer where masks those placeholder results - no
+        per-row branching, so the whole pass stays SIMD-friendly.
+        """
+        has_cost = self._amounts * self._costs > 0
+        safe_costs = np.where(has_cost, self._costs, np.float32(1.0))
+        return np.where(
+            has_cost,
+            (self._prices - self._costs) / safe_costs * np.float32(100.0),
+            np.float32(0.0)
+        )
+
+    @property
+    def total_value(self) -> float:
+        """Current market value of all positions (cached between mutations)"""
+        if self._total_value is None:
+            # vdot fuses the multiply and the sum without a temporary
+            self._total_value = float(np.vdot(self._amounts, self._prices))
+        return self._total_value
+
+    @property
+    def total_cost(self) -> float:
+        """Total acquisition cost of all positions (cached between mutations)"""
+        if self._total_cost is None:
+            self._total_cost = float(np.vdot(self._amounts, self._costs))
+        return self._total_cost
+
+    def analyze(self) -> PortfolioAnalysis:
+        """
+        Run full portfolio analysis
+
+        Returns:
+            PortfolioAnalysis with totals, scores and recommendations
+        """
+        if self._analysis_version == self._version:
+            return self._cached_analysis
+
+        values = self._amounts * self._prices
+        total_value, total_cost, largest, exposure, sq_sum = _analyze_core(
+            self._amounts, self._prices, self._costs, self._risk_weights
+        )
+        # Share the kernel's totals with the cached properties
+        self._total_value = total_value
+        self._total_cost = total_cost
+
+        # Partial sort: argpartition pulls the top five in O(n), then only
+        # those five get fully ordered
+        top_holdings = ()
+        k = min(5, len(values))
+        if k:
+            top = np.argpartition(values, -k)[-k:]
+            top = top[np.argsort(values[top])[::-1]]
+            pnl_pct = self.pnl_percentages()
+            top_holdings = tuple(
+                TopHolding(
+                    asset=self._assets[i],
+                    value=float(values[i]),
+                    pnl_pct=round(float(pnl_pct[i]), 2)
+                )
+                for i in top
+            )
+
+        # Both scores are functions of the position weights, so the
+        # normalization happens once here; zero-value portfolios keep the
+        # 0.0 defaults
+        weights = None
+        risk_score = 0.0
+        diversification_score = 0.0
+        if total_value > 0:
+            weights = values / total_value
+            risk_score = self._calculate_risk(total_value, largest, exposure)
+            diversification_score = self._calculate_diversification(
+                total_value, sq_sum
+            )
+
+        analysis = PortfolioAnalysis(
+            total_value=total_value,
+            total_cost=total_cost,
+            risk_score=risk_score,
+            diversification_score=diversification_score,
+            top_holdings=top_holdings,
+            recommendations=self._generate_recommendations(
+                total_value, risk_score, weights
+            )
+        )
+
+        self._cached_analysis = analysis
+        self._analysis_version = self._version
+        return analysis
+
+    def analyze_batch(self, price_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """Score many price scenarios in one vectorized pass
+
+        Instead of looping analyze() per scenario, every reduction runs
+        over the whole (scenarios, positions) matrix at once: one
+        broadcasted multiply for the value grid, then axis reductions for
+        the totals and scores. Intended for Monte Carlo / parameter
+        sweeps where scenarios share the current amounts and cost basis.
+
+        Args:
+            price_matrix: Per-unit prices, shape (n_scenarios, n_positions),
+                columns aligned with the portfolio's positions
+
+        Returns:
+            Dict of per-scenario arrays: total_value, unrealized_pnl,
+            risk_score and diversification_score, each shape (n_scenarios,)
+        """
+        prices = np.atleast_2d(np.asarray(price_matrix, dtype=np.float64))
+        if prices.shape[1] != self._assets.size:
+            raise ValueError(
+                f"price matrix has {prices.shape[1]} columns, "
+                f"portfolio has {self._assets.size} positions"
+            )
+
+        values = self._amounts[None, :] * prices
+        totals = values.sum(axis=1)
+        largest = values.max(axis=1, initial=0.0)
+        exposure = values @ self._risk_weights
+        sq_sum = np.einsum("sn,sn->s", values, values)
+
+        # Same branchless zero-total guard as pnl_percentages: divide by
+        # a placeholder, then mask those scenarios back to 0.0
+        funded = totals > 0
+        safe_totals = np.where(funded, totals, 1.0)
+        risk_scores = np.where(
+            funded,
+            np.minimum(
+                100.0, (exposure / safe_totals) * 60 + (largest / safe_totals) * 40
+            ),
+            0.0
+        ).round(2)
+        diversification_scores = np.where(
+            funded,
+            (1 - sq_sum / (safe_totals * safe_totals)) * 100,
+            0.0
+        ).round(2)
+
+        return {
+            "total_value": totals,
+            "unrealized_pnl": totals - self.total_cost,
+            "risk_score": risk_scores,
+            "diversification_score": diversification_scores
+        }
+
+    def _get_asset_type(self, asset: str) -> str:
+        """Map asset symbol to broad asset type"""
+        return _ASSET_TYPE_MAP.get(asset, AssetType.ALTCOIN).name
+
+    def _calculate_risk(self, total: float, largest: float, exposure: float) -> float:
+        """
+        Calculate portfolio risk score (0-100) from the core reductions
+
+        Weighted mix of type-weighted risk exposure and concentration
+        """
+        if total == 0:
+            return 0.0
+
+        risk = (exposure / total) * 60 + (largest / total) * 40
+
+        return round(min(100.0, float(risk)), 2)
+
+    def _calculate_diversification(self, total: float, sq_sum: float) -> float:
+        """
+        Calculate diversification score (0-100) from the core reductions
+
+        Based on inverted Herfindahl index of position weights
+        """
+        if total == 0:
+            return 0.0
+
+        hhi = sq_sum / (total * total)
+        return round((1 - hhi) * 100, 2)
+
+    def _generate_recommendations(
+        self,
+        total_value: float,
+        risk_score: float,
+        weights: Optional[np.ndarray] = None
+    ) -> Tuple[str, ...]:
+        """Generate rebalancing recommendations from the analysis inputs
+
+        The over-concentration and stablecoin checks read boolean masks
+        over the asset array instead of walking materialized holdings.
+        Returns a tuple so the frozen analysis carries no mutable state.
+        """
+        recommendations = []
+
+        if total_value == 0 or weights is None:
+            return ("Portfolio is empty - add holdings to begin analysis",)
+
+        for asset in self._assets[weights > 0.4]:
+            recommendations.append(
+                f"Reduce exposure to {asset} (over 40% of portfolio)"
+            )
+
+        if not self._stable_mask.any():
+            recommendations.append("Add stablecoin allocation for cash buffer")
+
+        if risk_score > 75:
+            recommendations.append("Portfolio risk is high - consider rebalancing")
+
+        return tuple(recommendations)
+
+    def __repr__(self) -> str:
+        return f"Portfolio({self._assets.size} holdings, ${self.total_value:,.2f})"
+
+
+def main():
+    """Example usage"""
+    portfolio = Portfolio([
+        {"asset": "BTC", "amount": 2.5, "avg_cost": 45000, "current_price": 65000},
+        {"asset": "ETH", "amount": 10, "avg_cost": 1550, "current_price": 2400},
+        {"asset": "USDC", "amount": 5000, "avg_cost": 1.0, "current_price": 1.0}
+    ])
+
+    print(portfolio)
+    print()
+
+    analysis = portfolio.analyze()
+    print("Portfolio Analysis:")
+    print(f"  Total Value: ${analysis.total_value:,.2f}")
+    print(f"  Total Cost: ${analysis.total_cost:,.2f}")
+    print(f"  Unrealized PnL: ${analysis.unrealized_pnl:,.2f} ({analysis.pnl_percentage:.1f}%)")
+    print(f"  Risk Score: {analysis.risk_score}")
+    print(f"  Diversification Score: {analysis.diversification_score}")
+
+    print("\nAllocation by type:")
+    for asset_type, value in zip(AssetType, portfolio.values_by_type()):
+        if value > 0:
+            print(f"  {asset_type.name}: ${value:,.2f}")
+
+    if analysis.recommendations:
+        print("\nRecommendations:")
+        for rec in analysis.recommendations:
+            print(f"  - {rec}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,35 +13,42 @@ Environment Variables:
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _env_cached(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Cached environment variable lookup (one dict probe per variable per process)"""
+    return os.getenv(name, default)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Global configuration for Crypto Retirement Strategy"""
 
     # MCP Server
-    mcp_server_url: str = os.getenv(
+    mcp_server_url: str = _env_cached(
         "MCP_SERVER_URL",
         "http://10.0.0.209:8000"
     )
 
     # Crypto API
-    crypto_api_key: Optional[str] = os.getenv("CRYPTO_API_KEY")
+    crypto_api_key: Optional[str] = _env_cached("CRYPTO_API_KEY")
     crypto_api_url: str = "https://api.coingecko.com/api/v3"
 
     # Portfolio/Exit Strategy
-    risk_tolerance: str = os.getenv("RISK_TOLERANCE", "moderate")
-    exit_method: str = os.getenv("EXIT_METHOD", "gradual")
+    risk_tolerance: str = _env_cached("RISK_TOLERANCE", "moderate")
+    exit_method: str = _env_cached("EXIT_METHOD", "gradual")
 
     # Retirement settings
-    retirement_age: int = int(os.getenv("RETIREMENT_AGE", 65))
-    retirement_goal: float = float(os.getenv("RETIREMENT_GOAL", 500000))
+    retirement_age: int = int(_env_cached("RETIREMENT_AGE", "65"))
+    retirement_goal: float = float(_env_cached("RETIREMENT_GOAL", "500000"))
 
     # Application settings
-    debug_mode: bool = os.getenv("DEBUG", "False").lower() == "true"
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    debug_mode: bool = _env_cached("DEBUG", "False").lower() == "true"
+    log_level: str = _env_cached("LOG_LEVEL", "INFO")
 
     # File paths
     project_root: Path = Path(__file__).parent.parent
@@ -59,15 +66,22 @@ class Config:
     target_value_adjustment: float = 1.0  # Adjustment for retirement goal
     risk_trigger_threshold: float = 60.0
 
+    # Directory syscalls happen at most once per process (class-level flag,
+    # not a dataclass field)
+    _ensured = False
+
     def __post_init__(self):
-        """Initialize directories"""
-        self.data_dir.mkdir(exist_ok=True)
-        self.logs_dir.mkdir(exist_ok=True)
-        self.config_dir.mkdir(exist_ok=True)
+        """Initialize directories (first instance only)"""
+        if not Config._ensured:
+            self.data_dir.mkdir(exist_ok=True)
+            self.logs_dir.mkdir(exist_ok=True)
+            self.config_dir.mkdir(exist_ok=True)
+            Config._ensured = True
 
     @classmethod
+    @lru_cache(maxsize=1)
     def load(cls) -> "Config":
-        """Load configuration from environment"""
+        """Load configuration from environment (cached singleton)"""
         return cls()
 
     def validate(self) -> bool:
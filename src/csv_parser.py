@@ -3,11 +3,110 @@ CSV Parser for Tax Lots
 Parses user CSV export and prepares data for HIFO engine
 """
 
-import csv
 from io import StringIO
-from typing import List, Dict, Optional
+from typing import List, Dict, Tuple
 from datetime import datetime
 
+import pandas as pd
+
+# Precompiled per-sale instruction template (filled via format_map)
+_SALE_TEMPLATE = (
+    "Asset: {asset}\n"
+    "Target Lot: {lot_id}\n"
+    "Amount: {sell_amount}\n"
+    "Cost Basis: ${cost_basis:,.2f}\n"
+    "Reason: High cost basis detected. Minimizes capital gains.\n"
+    "Location: {location}\n"
+    "Est. Gain/Loss: ${estimated_gain_loss:,.2f}\n"
+)
+
+_SALE_DEFAULTS = {
+    "asset": "BTC",
+    "lot_id": "N/A",
+    "sell_amount": 0,
+    "cost_basis": 0,
+    "location": "Unknown",
+    "estimated_gain_loss": 0
+}
+
+# Columns every export must provide (frozenset: O(1) membership checks)
+_REQUIRED_HEADERS = frozenset({"Asset", "Date_Acquired", "Quantity", "Cost_Basis_Per_Unit"})
+
+# Optional columns filled with defaults when the export omits them
+_OPTIONAL_COLUMNS = [
+    ("Fee_Paid", 0.0),
+    ("Currency", "USD"),
+    ("Exchange_Location", ""),
+    ("Notes", "")
+]
+
+
+def _read_tax_lots_frame(csv_content: str) -> pd.DataFrame:
+    """Read the CSV export into a DataFrame with defaults and total cost filled in"""
+    df = pd.read_csv(
+        StringIO(csv_content),
+        dtype={
+            "Quantity": float,
+            "Cost_Basis_Per_Unit": float,
+            "Fee_Paid": float
+        },
+        skip_blank_lines=True
+    )
+
+    # Fill in optional columns so downstream keys always exist
+    for column, default in _OPTIONAL_COLUMNS:
+        if column not in df.columns:
+            df[column] = default
+        else:
+            df[column] = df[column].fillna(default)
+
+    # Calculate total cost (vectorized over all rows); skipped when required
+    # columns are absent so validation can report them instead
+    if "Quantity" in df.columns and "Cost_Basis_Per_Unit" in df.columns:
+        df["total_cost"] = (df["Quantity"] * df["Cost_Basis_Per_Unit"]) + df["Fee_Paid"]
+
+    # Check if long-term (>365 days): parse all acquisition dates in one
+    # vectorized pass; unparseable dates become NaT and default to long-term
+    if "Date_Acquired" in df.columns:
+        acquired = pd.to_datetime(
+            df["Date_Acquired"].astype(str).str.slice(0, 10),
+            format="%Y-%m-%d",
+            errors="coerce"
+        )
+        cutoff = pd.Timestamp(datetime.now()) - pd.Timedelta(days=365)
+        df["is_long_term"] = (acquired <= cutoff).where(acquired.notna(), True)
+    else:
+        df["is_long_term"] = True
+
+    return df
+
+
+def _frame_to_lots(df: pd.DataFrame) -> List[Dict]:
+    """Convert a parsed DataFrame into tax lot dicts for the HIFO engine"""
+    # One strftime for the whole batch; strftime is surprisingly expensive
+    # (locale handling) to repeat per row
+    ts_prefix = datetime.now().strftime('%Y%m%d%H%M%S')
+
+    tax_lots = []
+    for i, row in enumerate(df.to_dict("records")):
+        lot = {
+            "lot_id": f"lot_{ts_prefix}_{i}",
+            "asset": str(row.get("Asset", "BTC")),
+            "date_acquired": str(row.get("Date_Acquired", "")),
+            "amount": float(row.get("Quantity", 0)),
+            "cost_basis": float(row.get("Cost_Basis_Per_Unit", 0)),
+            "fee_paid": float(row.get("Fee_Paid", 0)),
+            "currency": str(row.get("Currency", "USD")),
+            "exchange_location": str(row.get("Exchange_Location", "")),
+            "notes": str(row.get("Notes", "")),
+            "total_cost": float(row["total_cost"]),
+            "is_long_term": bool(row.get("is_long_term", True))
+        }
+
+        tax_lots.append(lot)
+
+    return tax_lots
+
 
 def parse_tax_lots_csv(csv_content: str) -> List[Dict]:
     """
@@ -16,81 +115,65 @@ def parse_tax_lots_csv(csv_content: str) -> List[Dict]:
     Expected format:
     Asset,Date_Acquired,Quantity,Cost_Basis_Per_Unit,Fee_Paid,Currency,Exchange_Location,Notes
     BTC,2021-11-10,0.5,68500.00,15.00,USD,Ledger,Buy
+
+    Raises:
+        ValueError: If the export is missing required columns
     """
-    lines = csv_content.strip().split('\n')
-    headers = [h.strip() for h in lines[0].split(',')]
+    df = _read_tax_lots_frame(csv_content)
+    missing = _REQUIRED_HEADERS.difference(df.columns)
+    if missing:
+        raise ValueError(
+            f"Missing required columns: {', '.join(sorted(missing))}"
+        )
+    return _frame_to_lots(df)
 
-    tax_lots = []
-    for line in lines[1:]:
-        if not line.strip():
-            continue
 
-        values = [v.strip() for v in line.split(',')]
+def parse_and_validate(csv_content: str) -> Tuple[Dict, List[Dict]]:
+    """
+    Validate and parse the CSV in a single pass
 
-        lot = {
-            "lot_id": f"lot_{datetime.now().strftime('%Y%m%d%H%M%S')}_{len(tax_lots)}",
-            "asset": values[0] if len(values) > 0 else "BTC",
-            "date_acquired": values[1] if len(values) > 1 else "",
-            "amount": float(values[2]) if len(values) > 2 else 0,
-            "cost_basis": float(values[3]) if len(values) > 3 else 0,
-            "fee_paid": float(values[4]) if len(values) > 4 else 0,
-            "currency": values[5] if len(values) > 5 else "USD",
-            "exchange_location": values[6] if len(values) > 6 else "",
-            "notes": values[7] if len(values) > 7 else ""
-        }
+    The CSV bytes are scanned once; validation checks run against the
+    already-parsed frame instead of re-splitting every line.
 
-        # Calculate total cost
-        lot["total_cost"] = (lot["amount"] * lot["cost_basis"]) + lot["fee_paid"]
+    Returns:
+        Tuple of (validation result, parsed tax lots)
+    """
+    if len(csv_content.strip().split('\n')) < 2:
+        return {"valid": False, "errors": ["CSV is empty or missing headers"]}, []
 
-        # Check if long-term (>365 days)
-        try:
-            acquisition_date = datetime.strptime(lot["date_acquired"].split()[0], "%Y-%m-%d")
-            one_year_ago = acquisition_date.replace(year=acquisition_date.year - 1)
-            lot["is_long_term"] = acquisition_date <= one_year_ago
-        except:
-            lot["is_long_term"] = True  # Default to long-term
+    try:
+        df = _read_tax_lots_frame(csv_content)
+    except (ValueError, pd.errors.ParserError) as e:
+        return {"valid": False, "errors": [f"Could not parse CSV: {e}"]}, []
 
-        tax_lots.append(lot)
+    missing = _REQUIRED_HEADERS.difference(df.columns)
+    if missing:
+        return {
+            "valid": False,
+            "errors": [f"Missing required columns: {', '.join(sorted(missing))}"]
+        }, []
 
-    return tax_lots
+    # Validate data rows: required fields must be present on every row
+    null_mask = df[list(_REQUIRED_HEADERS)].isnull().any(axis=1)
+    errors = [f"Row {i + 2}: Missing required columns" for i in df.index[null_mask]]
+
+    if errors:
+        return {"valid": False, "errors": errors}, []
+
+    return {"valid": True, "errors": []}, _frame_to_lots(df)
 
 
 def validate_csv_structure(csv_content: str) -> Dict:
     """
     Validate CSV structure
 
+    Thin wrapper over parse_and_validate kept for backward compatibility.
+
     Returns:
         Validation result with valid flag and errors
     """
-    lines = csv_content.strip().split('\n')
-    if len(lines) < 2:
-        return {"valid": False, "errors": ["CSV is empty or missing headers"]}
-
-    required_headers = ["Asset", "Date_Acquired", "Quantity", "Cost_Basis_Per_Unit"]
-    headers = [h.strip() for h in lines[0].split(',')]
-
-    missing = [h for h in required_headers if h not in headers]
-
-    if missing:
-        return {
-            "valid": False,
-            "errors": [f"Missing required columns: {', '.join(missing)}"]
-        }
-
-    # Validate data rows
-    errors = []
-    for i, line in enumerate(lines[1:], start=2):
-        if not line.strip():
-            continue
-
-        values = line.split(',')
-        if len(values) < 4:
-            errors.append(f"Row {i}: Missing required columns")
-
-    return {
-        "valid": len(errors) == 0,
-        "errors": errors
-    }
+    result, _ = parse_and_validate(csv_content)
+    return result
 
 
 def format_sell_instruction(sell_plan: List[Dict]) -> str:
@@ -106,28 +189,15 @@ def format_sell_instruction(sell_plan: List[Dict]) -> str:
     if not sell_plan:
         return "No sales required at this time."
 
-    instructions = ["STRATEGY ALERT:"]
-    instructions.append("")
-    instructions.append("Action: SELL RECOMMENDED")
-    instructions.append("")
-
-    for sale in sell_plan:
-        instructions.append(f"Asset: {sale.get('asset', 'BTC')}")
-        instructions.append(f"Target Lot: {sale.get('lot_id', 'N/A')}")
-        instructions.append(f"Amount: {sale.get('sell_amount', 0)}"
-        instructions.append(f"Cost Basis: ${sale.get('cost_basis', 0):,.2f}")
-        instructions.append(f"Reason: High cost basis detected. Minimizes capital gains.")
-        instructions.append(f"Location: {sale.get('location', 'Unknown')}")
-        instructions.append(f"Est. Gain/Loss: ${sale.get('estimated_gain_loss', 0):,.2f}")
-        instructions.append("")
-
-    return "\n".join(instructions)
+    return "STRATEGY ALERT:\n\nAction: SELL RECOMMENDED\n\n" + "\n".join(
+        _SALE_TEMPLATE.format_map({**_SALE_DEFAULTS, **sale}) for sale in sell_plan
+    )
 
 
 def main():
     """Test CSV parsing"""
     csv_content = """Asset,Date_Acquired,Quantity,Cost_Basis_Per_Unit,Fee_Paid,Currency,Exchange_Location,Notes
-BTC,2021-11-10 14:30:05,0.5,68500.00,15.00,USD,Ledger,Bull market peak buy
+BTC,2021-11-10 14:30:05,0.5,68500.00,15.00,USD,Ledger,"Bull market, peak buy"
 BTC,2022-06-15 09:00:00,1.2,21000.00,5.50,USD,Coinbase,Bear market accumulation
 ETH,2023-01-20 12:15:00,10.0,1550.00,12.00,USD,Kraken,Staking principal
 """
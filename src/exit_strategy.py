@@ -0,0 +1,232 @@
+"""
+Exit Strategy - Crypto Retirement Strategy
+Builds exit plans and turns portfolio analysis into sell recommendations
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import List, Dict, Optional
+
+from .analyze_portfolio import Portfolio
+
+
+@dataclass(slots=True)
+class AnalysisSnapshot:
+    """Per-tick analysis values the exit checks read (slot attribute access
+    instead of repeated dict probes)"""
+    total_value: float = 0.0
+    pnl_percentage: float = 0.0
+    risk_score: float = 0.0
+
+    @classmethod
+    def from_analysis(cls, analysis) -> "AnalysisSnapshot":
+        """Build a snapshot from a PortfolioAnalysis or a plain dict"""
+        if isinstance(analysis, dict):
+            return cls(
+                total_value=analysis.get("total_value", 0),
+                pnl_percentage=analysis.get("pnl_percentage", 0),
+                risk_score=analysis.get("risk_score", 0)
+            )
+        return cls(
+            total_value=analysis.total_value,
+            pnl_percentage=analysis.pnl_percentage,
+            risk_score=analysis.risk_score
+        )
+
+
+class ExitTrigger(Enum):
+    """Conditions that can trigger an exit"""
+    TARGET_VALUE = "target_value"
+    PERCENTAGE_GAIN = "percentage_gain"
+    RISK_THRESHOLD = "risk_threshold"
+
+
+@dataclass(slots=True)
+class ExitCondition:
+    """Single exit trigger with its threshold"""
+    trigger: ExitTrigger
+    threshold: float
+    description: str = ""
+
+
+@dataclass(slots=True)
+class ExitPlan:
+    """Exit plan: a method plus the conditions that trigger it"""
+    exit_method: str
+    conditions: List[ExitCondition] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+@dataclass(slots=True)
+class ExitRecommendation:
+    """Actionable sell recommendation"""
+    action: str
+    assets: Dict[str, float]
+    amount: float
+    reason: str
+    urgency: str = "normal"
+
+
+# risk_tolerance -> (gain_threshold, risk_threshold)
+_RISK_PRESETS = {
+    "aggressive": (50.0, 70.0),
+    "moderate": (75.0, 60.0),
+    "conservative": (100.0, 50.0)
+}
+
+
+class ExitStrategy:
+    """
+    Exit Strategy Engine
+    Evaluates exit conditions against portfolio analysis snapshots
+    """
+
+    def __init__(self, portfolio: Portfolio, risk_tolerance: str = "moderate"):
+        """
+        Initialize exit strategy
+
+        Args:
+            portfolio: Portfolio to generate exits for
+            risk_tolerance: conservative, moderate, aggressive
+        """
+        self.portfolio = portfolio
+        self.risk_tolerance = risk_tolerance
+        self.exit_plan: Optional[ExitPlan] = None
+
+    def create_exit_plan(self, retirement_goal: float, exit_method: str = "gradual") -> ExitPlan:
+        """
+        Create an exit plan for a retirement goal
+
+        Args:
+            retirement_goal: Target portfolio value (USD)
+            exit_method: gradual, staged, or immediate
+
+        Returns:
+            ExitPlan with generated conditions
+        """
+        self.exit_plan = ExitPlan(
+            exit_method=exit_method,
+            conditions=self._generate_conditions(retirement_goal)
+        )
+        return self.exit_plan
+
+    def _generate_conditions(self, retirement_goal: float) -> List[ExitCondition]:
+        """Generate exit conditions based on risk tolerance"""
+        gain_threshold, risk_threshold = _RISK_PRESETS.get(
+            self.risk_tolerance, _RISK_PRESETS["moderate"]
+        )
+
+        return [
+            ExitCondition(
+                trigger=ExitTrigger.TARGET_VALUE,
+                threshold=retirement_goal,
+                description=f"Portfolio reached retirement goal of ${retirement_goal:,.0f}"
+            ),
+            ExitCondition(
+                trigger=ExitTrigger.PERCENTAGE_GAIN,
+                threshold=gain_threshold,
+                description=f"Portfolio gained {gain_threshold:.0f}% over cost basis"
+            ),
+            ExitCondition(
+                trigger=ExitTrigger.RISK_THRESHOLD,
+                threshold=risk_threshold,
+                description=f"Portfolio risk exceeded {risk_threshold:.0f}"
+            )
+        ]
+
+    # Trigger dispatch table: one dict lookup per check instead of an
+    # if/elif chain of enum comparisons
+    _CHECKS = {
+        ExitTrigger.TARGET_VALUE: lambda a, t: a.total_value >= t,
+        ExitTrigger.PERCENTAGE_GAIN: lambda a, t: a.pnl_percentage >= t,
+        ExitTrigger.RISK_THRESHOLD: lambda a, t: a.risk_score >= t
+    }
+
+    def _check_condition(self, condition: ExitCondition, analysis: AnalysisSnapshot) -> bool:
+        """Check a single exit condition against an analysis snapshot"""
+        check = ExitStrategy._CHECKS.get(condition.trigger)
+        return bool(check and check(analysis, condition.threshold))
+
+    def should_exit(self, analysis: AnalysisSnapshot) -> bool:
+        """
+        Check whether any exit condition is met
+
+        Args:
+            analysis: Portfolio analysis snapshot
+
+        Returns:
+            True if at least one condition triggered
+        """
+        if not self.exit_plan:
+            return False
+
+        return any(
+            self._check_condition(c, analysis) for c in self.exit_plan.conditions
+        )
+
+    def generate_recommendations(self, analysis: AnalysisSnapshot) -> List[ExitRecommendation]:
+        """
+        Generate sell recommendations for all triggered conditions
+
+        Args:
+            analysis: Portfolio analysis snapshot
+
+        Returns:
+            List of ExitRecommendation, one per triggered condition
+        """
+        recommendations = []
+        if not self.exit_plan:
+            return recommendations
+
+        for condition in self.exit_plan.conditions:
+            if self._check_condition(condition, analysis):
+                recommendations.append(self._create_recommendation(condition))
+        return recommendations
+
+    def _create_recommendation(self, condition: ExitCondition) -> ExitRecommendation:
+        """Build a sell recommendation for a triggered condition"""
+        # Single pass over the top holdings: build (asset, amount) pairs once,
+        # then derive both the total and the asset dict from them
+        items = [(h.asset, h.amount * 0.25) for h in self.portfolio.holdings[:3]]
+        amount = math.fsum(v for _, v in items)
+        assets = dict(items)
+
+        return ExitRecommendation(
+            action="sell",
+            assets=assets,
+            amount=amount,
+            reason=f"{condition.trigger.value} triggered: {condition.description}",
+            urgency="high" if condition.trigger == ExitTrigger.RISK_THRESHOLD else "normal"
+        )
+
+
+def main():
+    """Example usage"""
+    portfolio = Portfolio([
+        {"asset": "BTC", "amount": 2.5, "avg_cost": 45000, "current_price": 65000},
+        {"asset": "ETH", "amount": 10, "avg_cost": 1550, "current_price": 2400},
+        {"asset": "USDC", "amount": 5000, "avg_cost": 1.0, "current_price": 1.0}
+    ])
+
+    strategy = ExitStrategy(portfolio, risk_tolerance="moderate")
+    plan = strategy.create_exit_plan(retirement_goal=500000)
+
+    print(f"Exit Plan ({plan.exit_method}):")
+    for condition in plan.conditions:
+        print(f"  - {condition.description}")
+    print()
+
+    snapshot = AnalysisSnapshot.from_analysis(portfolio.analyze())
+
+    print(f"Should exit: {strategy.should_exit(snapshot)}")
+    for rec in strategy.generate_recommendations(snapshot):
+        print(f"\nRecommendation: {rec.action.upper()} ({rec.urgency})")
+        print(f"  Reason: {rec.reason}")
+        for asset, amount in rec.assets.items():
+            print(f"  {asset}: {amount}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Market Monitor - Crypto Retirement Strategy
+Watches crypto market conditions and emits buy/hold/sell signals
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Deque, Dict, Optional
+
+import httpx
+import numpy as np
+
+from .config import config
+
+
+class MarketCondition(Enum):
+    """Broad market regimes"""
+    BULL = "bull"
+    BEAR = "bear"
+    SIDEWAYS = "sideways"
+    VOLATILE = "volatile"
+
+
+@dataclass(slots=True)
+class MarketData:
+    """Snapshot of market state for one tick"""
+    timestamp: str
+    btc_price: float
+    eth_price: float
+    total_market_cap: float
+    volatility: float
+
+
+@dataclass(slots=True)
+class MarketSignal:
+    """Signal emitted for a market condition"""
+    condition: MarketCondition
+    action: str
+    confidence: float
+    message: str
+    timestamp: str
+
+
+# Reference BTC price for percent-change classification
+_BTC_BASELINE_PRICE = 50000.0
+
+# Condition -> recommended action, frozen at import
+_ACTION_MAP = {
+    MarketCondition.BULL: "hold",
+    MarketCondition.BEAR: "buy",
+    MarketCondition.SIDEWAYS: "hold",
+    MarketCondition.VOLATILE: "reduce"
+}
+
+# Ticks of history to retain (bounds memory in long-running monitors)
+_HISTORY_MAXLEN = 10_000
+
+
+class MarketHistory:
+    """
+    Structure-of-arrays ring buffer of market snapshots
+
+    Prices, caps and volatility live in parallel preallocated NumPy arrays
+    so windowed analytics (moving averages, rolling volatility) run as
+    vectorized reductions instead of walking MarketData objects.
+    """
+
+    def __init__(self, capacity: int = _HISTORY_MAXLEN):
+        self.capacity = capacity
+        # float32 is ample for prices/volatility (<8 significant digits) and
+        # halves the footprint; market cap exceeds 2**24 so it stays float64
+        self.btc_price = np.empty(capacity, dtype=np.float32)
+        self.eth_price = np.empty(capacity, dtype=np.float32)
+        self.market_cap = np.empty(capacity, dtype=np.float64)
+        self.volatility = np.empty(capacity, dtype=np.float32)
+        self.n = 0  # total snapshots ever appended
+
+    def __len__(self) -> int:
+        return min(self.n, self.capacity)
+
+    def append(self, data: MarketData) -> None:
+        """Write one snapshot into the ring buffer"""
+        i = self.n % self.capacity
+        self.btc_price[i] = data.btc_price
+        self.eth_price[i] = data.eth_price
+        self.market_cap[i] = data.total_market_cap
+        self.volatility[i] = data.volatility
+        self.n += 1
+
+    def _tail(self, arr: np.ndarray, window: int) -> np.ndarray:
+        """Last min(window, len) values of a field in chronological order"""
+        size = len(self)
+        w = min(window, size)
+        end = self.n % self.capacity if self.n >= self.capacity else self.n
+        idx = np.arange(end - w, end) % self.capacity
+        return arr[idx]
+
+    def moving_average(self, window: int = 24) -> float:
+        """Moving average of BTC price over the trailing window"""
+        if len(self) == 0:
+            return 0.0
+        return float(np.mean(self._tail(self.btc_price, window)))
+
+    def rolling_volatility(self, window: int = 24) -> float:
+        """Std deviation of BTC price returns over the trailing window"""
+        if len(self) < 2:
+            return 0.0
+        prices = self._tail(self.btc_price, window)
+        returns = np.diff(prices) / prices[:-1]
+        return float(np.std(returns))
+
+# Shared async HTTP clients, one per event loop, so TCP/TLS setup is
+# amortized across ticks. Pooled keep-alive connections are bound to the
+# loop they were opened on: a client created under one asyncio.run would
+# fail on the next run's loop, so each loop gets its own client
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazy shared AsyncClient for the running event loop"""
+    for stale in [loop for loop in _clients if loop.is_closed()]:
+        # The loop is gone, so the client can't be awaited closed; drop
+        # the reference and let its sockets be reclaimed
+        del _clients[stale]
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=5.0)
+        _clients[loop] = client
+    return client
+
+
+class MarketMonitor:
+    """
+    Crypto Market Monitor
+    Fetches market data and classifies current conditions
+    """
+
+    def __init__(self, api_url: Optional[str] = None):
+        self.api_url = api_url or config.crypto_api_url
+        self.current_data: Optional[MarketData] = None
+        self.historical_data: Deque[MarketData] = deque(maxlen=_HISTORY_MAXLEN)
+        # SoA mirror of the history for vectorized windowed analytics
+        self.history = MarketHistory(_HISTORY_MAXLEN)
+        # Memoized (snapshot, (condition, volatility, price_change)) pair so
+        # repeated queries on the same tick classify only once
+        self._classified = None
+
+    async def fetch_market_data_async(self) -> MarketData:
+        """
+        Fetch latest market data (async)
+
+        Price and global-market requests are issued concurrently over the
+        shared client; falls back to sample data when the API is unreachable.
+
+        Returns:
+            MarketData snapshot for this tick
+        """
+        client = _get_client()
+        try:
+            price_resp, global_resp = await asyncio.gather(
+                client.get(
+                    f"{self.api_url}/simple/price",
+                    params={
+                        "ids": "bitcoin,ethereum",
+                        "vs_currencies": "usd",
+                        "include_24hr_change": "true"
+                    }
+                ),
+                client.get(f"{self.api_url}/global")
+            )
+            price_resp.raise_for_status()
+            global_resp.raise_for_status()
+
+            prices = price_resp.json()
+            market = global_resp.json().get("data", {})
+
+            data = MarketData(
+                timestamp=datetime.now().isoformat(),
+                btc_price=float(prices["bitcoin"]["usd"]),
+                eth_price=float(prices["ethereum"]["usd"]),
+                total_market_cap=float(
+                    market.get("total_market_cap", {}).get("usd", 0)
+                ),
+                volatility=abs(float(prices["bitcoin"].get("usd_24h_change", 0)))
+            )
+        except (httpx.HTTPError, KeyError, ValueError):
+            # API unreachable or returned an unexpected payload; local
+            # bugs (e.g. a client bound to a dead loop) propagate instead
+            # of being masked by fabricated prices
+            data = self._sample_data()
+
+        self.current_data = data
+        self.historical_data.append(data)
+        self.history.append(data)
+        return data
+
+    def fetch_market_data(self) -> MarketData:
+        """Synchronous wrapper around fetch_market_data_async"""
+        return asyncio.run(self.fetch_market_data_async())
+
+    def _sample_data(self) -> MarketData:
+        """Offline fallback market snapshot"""
+        return MarketData(
+            timestamp=datetime.now().isoformat(),
+            btc_price=65000.0,
+            eth_price=2400.0,
+            total_market_cap=2.3e12,
+            volatility=3.2
+        )
+
+    def _classify(self, data: MarketData):
+        """
+        Compute (condition, volatility, price_change) once per snapshot
+
+        The result is memoized against the snapshot object so confidence,
+        message and action generation all reuse one classification pass.
+        """
+        if self._classified is not None and self._classified[0] is data:
+            return self._classified[1]
+
+        volatility = data.volatility
+        price_change = (data.btc_price - _BTC_BASELINE_PRICE) / _BTC_BASELINE_PRICE
+
+        if volatility > 8.0:
+            condition = MarketCondition.VOLATILE
+        elif price_change > 0.15:
+            condition = MarketCondition.BULL
+        elif price_change < -0.15:
+            condition = MarketCondition.BEAR
+        else:
+            condition = MarketCondition.SIDEWAYS
+
+        self._classified = (data, (condition, volatility, price_change))
+        return self._classified[1]
+
+    def analyze_market_condition(self) -> MarketCondition:
+        """
+        Classify the current market condition
+
+        Returns:
+            MarketCondition for the latest snapshot
+        """
+        if self.current_data is None:
+            return MarketCondition.SIDEWAYS
+        return self._classify(self.current_data)[0]
+
+    def generate_signal(self) -> MarketSignal:
+        """
+        Generate an actionable signal for the current market condition
+
+        Returns:
+            MarketSignal with action, confidence and message
+        """
+        if self.current_data is None:
+            return MarketSignal(
+                condition=MarketCondition.SIDEWAYS,
+                action="hold",
+                confidence=0.0,
+                message="No market data available",
+                timestamp=datetime.now().isoformat()
+            )
+
+        condition, volatility, price_change = self._classify(self.current_data)
+
+        return MarketSignal(
+            condition=condition,
+            action=self._determine_action(condition),
+            confidence=self._calculate_confidence(condition, volatility, price_change),
+            message=self._generate_message(condition, volatility, price_change),
+            timestamp=datetime.now().isoformat()
+        )
+
+    def _calculate_confidence(
+        self, condition: MarketCondition, volatility: float, price_change: float
+    ) -> float:
+        """Confidence score (0-100) for the classification"""
+        if condition == MarketCondition.VOLATILE:
+            return round(min(100.0, volatility * 5), 2)
+        return round(min(100.0, 50 + abs(price_change) * 100), 2)
+
+    def _generate_message(
+        self, condition: MarketCondition, volatility: float, price_change: float
+    ) -> str:
+        """Human-readable summary of the current condition"""
+        return (
+            f"Market is {condition.value}: BTC at "
+            f"${self.current_data.btc_price:,.0f} "
+            f"({price_change:+.1%} vs baseline), "
+            f"volatility {volatility:.1f}"
+        )
+
+    def _determine_action(self, condition: MarketCondition) -> str:
+        """Map market condition to a recommended action"""
+        return _ACTION_MAP.get(condition, "hold")
+
+
+def main():
+    """Example usage"""
+    monitor = MarketMonitor()
+
+    print("Fetching market data...")
+    data = monitor.fetch_market_data()
+    print(f"  BTC: ${data.btc_price:,.2f}")
+    print(f"  ETH: ${data.eth_price:,.2f}")
+    print(f"  Market Cap: ${data.total_market_cap:,.0f}")
+    print(f"  Volatility: {data.volatility:.2f}")
+    print()
+
+    signal = monitor.generate_signal()
+    print(f"Condition: {signal.condition.value}")
+    print(f"Action: {signal.action}")
+    print(f"Confidence: {signal.confidence}")
+    print(f"Message: {signal.message}")
+
+
+if __name__ == "__main__":
+    main()
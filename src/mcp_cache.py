@@ -0,0 +1,134 @@
+"""
+MCP Response Cache - Crypto Retirement Strategy
+File-backed record/replay cache wrapping an MCP client
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .mcp_client import ChatResponse, MCPClient
+
+# Cache behavior, read from the environment per call so test runs can
+# flip modes without rebuilding clients:
+#   replay - serve hits from disk, fall through to the server on miss
+#   record - always call the server and store the response
+#   off    - pass straight through to the inner client
+_MODE_ENV = "MCP_CACHE_MODE"
+
+
+def _cache_mode() -> str:
+    return os.environ.get(_MODE_ENV, "replay").lower()
+
+
+class CachedMCPClient:
+    """
+    File-backed cache around MCPClient
+
+    Responses persist across process restarts, so repeated backtests and
+    scenario sweeps replay recorded LLM output instead of re-paying a
+    server round trip per prompt. Writes are atomic (temp file +
+    os.replace), so a crashed run never leaves a torn cache entry.
+    Unknown attributes delegate to the inner client.
+    """
+
+    def __init__(self, inner: MCPClient, cache_dir: str = "./mcp_cache"):
+        """
+        Initialize cached client
+
+        Args:
+            inner: Client that performs real server requests
+            cache_dir: Directory holding one JSON file per response
+        """
+        self.inner = inner
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key(message: str, model: str, temperature: float, system: Optional[str]) -> str:
+        text = f"{system}\n{message}" if system else message
+        return hashlib.sha256(f"{model}|{temperature}|{text}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, path: Path) -> Optional[ChatResponse]:
+        """Read a cached response; None when absent or unreadable"""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return ChatResponse(
+            content=data["content"],
+            finish_reason=data["finish_reason"],
+            model=data["model"],
+            success=data["success"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
+    def _store(self, path: Path, response: ChatResponse) -> None:
+        """Write a response atomically (temp file in-dir, then os.replace)"""
+        payload = json.dumps({
+            "content": response.content,
+            "finish_reason": response.finish_reason,
+            "model": response.model,
+            "success": response.success,
+            "timestamp": response.timestamp.isoformat()
+        })
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def chat(
+        self,
+        message: str,
+        model: str = "phi-3-local",
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        system: Optional[str] = None
+    ) -> ChatResponse:
+        """
+        Chat with record/replay caching around the inner client
+
+        Args:
+            message: User message
+            model: Model name (default: phi-3-local)
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+            system: Optional static system prompt
+
+        Returns:
+            ChatResponse, from disk on a replay hit
+        """
+        mode = _cache_mode()
+        if mode == "off":
+            return self.inner.chat(message, model, temperature, max_tokens, system)
+
+        path = self._path(self._key(message, model, temperature, system))
+
+        if mode != "record":
+            cached = self._load(path)
+            if cached is not None:
+                return cached
+
+        response = self.inner.chat(message, model, temperature, max_tokens, system)
+        if response.success:
+            self._store(path, response)
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
@@ -3,11 +3,62 @@ MCP Client - Crypto Retirement Strategy
 Connection to AMD GPU-accelerated AI Model Server
 """
 
+import asyncio
+import atexit
+import hashlib
+import re
+import time
+from functools import lru_cache
+
 import httpx
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+try:  # orjson is optional; stdlib json is the fallback
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# Pre-serialized payloads are posted as raw bytes with this header
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared HTTP client: connections stay warm across MCPClient instances so
+# short-lived clients don't re-pay TCP/TLS setup per request
+_GLOBAL_CLIENT: Optional[httpx.Client] = None
+
+
+def _get_global_client() -> httpx.Client:
+    """Lazy shared keep-alive client initialization"""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is None or _GLOBAL_CLIENT.is_closed:
+        _GLOBAL_CLIENT = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            )
+        )
+    return _GLOBAL_CLIENT
+
+
+def _close_global_client():
+    if _GLOBAL_CLIENT is not None and not _GLOBAL_CLIENT.is_closed:
+        _GLOBAL_CLIENT.close()
+
+
+atexit.register(_close_global_client)
+
 
 @dataclass
 class ChatMessage:
@@ -26,31 +77,240 @@ class ChatResponse:
     timestamp: datetime
 
 
+# Responses are only cached for near-deterministic sampling; caching
+# high-temperature output would pin one arbitrary sample as "the" answer
+_CACHE_MAX_TEMPERATURE = 0.3
+
+# Cached responses expire after a day so market commentary can't go stale
+_CACHE_TTL_SECONDS = 24 * 3600.0
+
+
+class ResponseCache:
+    """
+    In-memory cache of chat responses for low-temperature prompts
+
+    Keys normalize whitespace and case, so re-running a scenario whose
+    prompt differs only cosmetically still hits. Entries expire after a
+    TTL to bound staleness.
+    """
+
+    def __init__(self, ttl: float = _CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._store: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _key(message: str, model: str, temperature: float) -> str:
+        normalized = re.sub(r"\s+", " ", message.strip().lower())
+        return hashlib.sha256(
+            f"{model}|{temperature:.2f}|{normalized}".encode()
+        ).hexdigest()
+
+    def get(self, message: str, model: str, temperature: float) -> Optional["ChatResponse"]:
+        """Return a cached response, or None on miss/expiry"""
+        entry = self._store.get(self._key(message, model, temperature))
+        if entry is None or (time.monotonic() - entry[0]) > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, message: str, model: str, temperature: float, response: "ChatResponse") -> None:
+        """Store a successful response"""
+        self._store[self._key(message, model, temperature)] = (time.monotonic(), response)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+# Coalescing window: requests arriving within this many seconds of each
+# other are batched into one concurrent flight
+_BATCH_WINDOW_SECONDS = 0.2
+
+# Maximum requests per coalesced flight
+_MAX_BATCH_SIZE = 8
+
+
+# Static instruction prefixes, kept byte-identical across calls so the
+# inference server's prefix (KV) cache can reuse them; per-call data goes
+# in the short user message only
+_SYSTEM_PROMPT_ANALYZE = """You are a cryptocurrency retirement planning assistant.
+Analyze the portfolio the user provides for retirement exit strategy.
+
+Provide analysis on:
+1. Portfolio diversification
+2. Risk exposure
+3. Exit timing recommendations
+4. Optimal exit strategies"""
+
+_SYSTEM_PROMPT_RECOMMEND = """You are a cryptocurrency retirement planning assistant.
+Recommend an exit strategy for the user's cryptocurrency retirement.
+
+Consider:
+1. Tax implications
+2. Market timing
+3. Risk management
+4. Diversification needs
+5. Withdrawal strategies"""
+
+
+# Sentinel spliced into payload templates where the user message goes;
+# the control chars make an accidental collision with real text implausible
+_PAYLOAD_PLACEHOLDER = "\x00__user_message__\x00"
+
+
+@lru_cache(maxsize=32)
+def _payload_template(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system: Optional[str]
+) -> tuple:
+    """Pre-serialized (prefix, suffix) bytes around the user message slot
+
+    Model name, system prompt and sampling parameters are stable across a
+    session, so their JSON encoding is paid once per combination; per-call
+    serialization shrinks to escaping the user message itself.
+    """
+    messages = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": _PAYLOAD_PLACEHOLDER})
+
+    serialized = _json_dumps({
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    })
+    prefix, suffix = serialized.split(_json_dumps(_PAYLOAD_PLACEHOLDER))
+    return prefix, suffix
+
+
+def _build_chat_payload(
+    message: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system: Optional[str] = None
+) -> bytes:
+    """Serialize a chat completion request from a cached template"""
+    prefix, suffix = _payload_template(model, temperature, max_tokens, system)
+    return prefix + _json_dumps(message) + suffix
+
+
+def _parse_chat_data(data: Dict, model: str) -> ChatResponse:
+    """Turn a chat completion response body into a ChatResponse"""
+    choices = data.get("data", {}).get("choices", [])
+    if not choices:
+        return ChatResponse(
+            content="No response generated",
+            finish_reason="error",
+            model=model,
+            success=False,
+            timestamp=datetime.now()
+        )
+
+    choice = choices[0]
+    message_data = choice.get("message", {})
+
+    return ChatResponse(
+        content=message_data.get("content", ""),
+        finish_reason=choice.get("finish_reason", "unknown"),
+        model=data.get("model", model),
+        success=data.get("success", False),
+        timestamp=datetime.now()
+    )
+
+
+def _error_response(exc: Exception, model: str) -> ChatResponse:
+    """ChatResponse for a failed request"""
+    return ChatResponse(
+        content=f"Error: {str(exc)}",
+        finish_reason="error",
+        model=model,
+        success=False,
+        timestamp=datetime.now()
+    )
+
+
+# User-message templates, interned once at import and filled per call;
+# layout changes happen here rather than inside the builders
+_ANALYZE_PROMPT_TEMPLATE = """Portfolio:
+{holdings}
+
+Market Conditions:
+{market_conditions}"""
+
+_RECOMMEND_PROMPT_TEMPLATE = """I have a crypto portfolio currently worth ${portfolio_value:,.2f}.
+My retirement goal is ${retirement_goal:,.2f}.
+I am currently {current_age} years old and plan to retire at {retirement_age}.
+
+What exit strategy would you recommend for my cryptocurrency retirement?"""
+
+
+def _build_analyze_prompt(
+    portfolio: Dict[str, float], market_conditions: Optional[Dict] = None
+) -> str:
+    """Build the dynamic (user) part of the portfolio-analysis prompt
+
+    Holdings are sorted so equal portfolios always serialize identically,
+    which keeps cache keys stable regardless of dict insertion order.
+    """
+    return _ANALYZE_PROMPT_TEMPLATE.format(
+        holdings="\n".join(
+            f"{asset}: {amount}" for asset, amount in sorted(portfolio.items())
+        ),
+        market_conditions=market_conditions or "Current market data not provided"
+    )
+
+
+def _build_recommend_prompt(
+    portfolio_value: float,
+    retirement_goal: float,
+    current_age: int,
+    retirement_age: int
+) -> str:
+    """Build the dynamic (user) part of the exit-strategy prompt"""
+    return _RECOMMEND_PROMPT_TEMPLATE.format(
+        portfolio_value=portfolio_value,
+        retirement_goal=retirement_goal,
+        current_age=current_age,
+        retirement_age=retirement_age
+    )
+
+
 class MCPClient:
     """
     Client for MCP (Model Control Protocol) Server
     Connects to AMD GPU-accelerated inference server
     """
 
-    def __init__(self, server_url: str = "http://10.0.0.209:8000"):
+    def __init__(
+        self,
+        server_url: str = "http://10.0.0.209:8000",
+        session: Optional[httpx.Client] = None
+    ):
         self.server_url = server_url
         self.api_endpoint = f"{server_url}/v1/chat/completions"
         self.health_endpoint = f"{server_url}/"
-        self._session = None
+        self._session = session  # optional injected override
+        self.cache = ResponseCache()
 
     @property
     def session(self) -> httpx.Client:
-        """Lazy HTTP session initialization"""
-        if self._session is None:
-            self._session = httpx.Client(timeout=30.0)
-        return self._session
+        """Injected session if given, otherwise the shared keep-alive client"""
+        if self._session is not None:
+            return self._session
+        return _get_global_client()
 
     def check_health(self) -> Dict:
         """Check server health status"""
         try:
             response = self.session.get(self.health_endpoint)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -59,7 +319,8 @@ class MCPClient:
         message: str,
         model: str = "phi-3-local",
         temperature: float = 0.7,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        system: Optional[str] = None
     ) -> ChatResponse:
         """
         Send chat completion request to MCP server
@@ -69,56 +330,37 @@ class MCPClient:
             model: Model name (default: phi-3-local)
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens to generate
+            system: Optional static system prompt (kept byte-identical
+                across calls to stay prefix-cache friendly)
 
         Returns:
             ChatResponse with AI-generated content
         """
-        payload = {
-            "model": model,
-            "messages": [{"role": "user", "content": message}],
-            "temperature": temperature,
-            "max_tokens": max_tokens
-        }
+        cache_text = f"{system}\n{message}" if system else message
+        cacheable = temperature <= _CACHE_MAX_TEMPERATURE
+        if cacheable:
+            cached = self.cache.get(cache_text, model, temperature)
+            if cached is not None:
+                return cached
+
+        payload = _build_chat_payload(message, model, temperature, max_tokens, system)
 
         try:
             response = self.session.post(
                 self.api_endpoint,
-                json=payload
+                content=payload,
+                headers=_JSON_HEADERS
             )
             response.raise_for_status()
 
-            data = response.json()
-
-            # Extract response data
-            choices = data.get("data", {}).get("choices", [])
-            if not choices:
-                return ChatResponse(
-                    content="No response generated",
-                    finish_reason="error",
-                    model=model,
-                    success=False,
-                    timestamp=datetime.now()
-                )
-
-            choice = choices[0]
-            message_data = choice.get("message", {})
-
-            return ChatResponse(
-                content=message_data.get("content", ""),
-                finish_reason=choice.get("finish_reason", "unknown"),
-                model=data.get("model", model),
-                success=data.get("success", False),
-                timestamp=datetime.now()
-            )
+            result = _parse_chat_data(_json_loads(response.content), model)
 
         except Exception as e:
-            return ChatResponse(
-                content=f"Error: {str(e)}",
-                finish_reason="error",
-                model=model,
-                success=False,
-                timestamp=datetime.now()
-            )
+            return _error_response(e, model)
+
+        if cacheable and result.success:
+            self.cache.put(cache_text, model, temperature, result)
+        return result
 
     def analyze_portfolio(
         self,
@@ -135,23 +377,10 @@ class MCPClient:
         Returns:
             AI analysis text
         """
-        prompt = f"""
-Analyze the following cryptocurrency portfolio for retirement exit strategy:
-
-Portfolio:
-{chr(10).join([f'{asset}: {amount}' for asset, amount in portfolio.items()])}
-
-Market Conditions:
-{market_conditions if market_conditions else 'Current market data not provided'}
-
-Provide analysis on:
-1. Portfolio diversification
-2. Risk exposure
-3. Exit timing recommendations
-4. Optimal exit strategies
-"""
-
-        response = self.chat(prompt, temperature=0.3, max_tokens=800)
+        prompt = _build_analyze_prompt(portfolio, market_conditions)
+        response = self.chat(
+            prompt, temperature=0.3, max_tokens=800, system=_SYSTEM_PROMPT_ANALYZE
+        )
         return response.content
 
     def recommend_exit_strategy(
@@ -173,25 +402,16 @@ Provide analysis on:
         Returns:
             Recommended exit strategy
         """
-        prompt = f"""
-I have a crypto portfolio currently worth ${portfolio_value:,.2f}.
-My retirement goal is ${retirement_goal:,.2f}.
-I am currently {current_age} years old and plan to retire at {retirement_age}.
-
-What exit strategy would you recommend for my cryptocurrency retirement?
-Consider:
-1. Tax implications
-2. Market timing
-3. Risk management
-4. Diversification needs
-5. Withdrawal strategies
-"""
-
-        response = self.chat(prompt, temperature=0.5, max_tokens=1000)
+        prompt = _build_recommend_prompt(
+            portfolio_value, retirement_goal, current_age, retirement_age
+        )
+        response = self.chat(
+            prompt, temperature=0.5, max_tokens=1000, system=_SYSTEM_PROMPT_RECOMMEND
+        )
         return response.content
 
     def close(self):
-        """Close HTTP session"""
+        """Close an injected session (the shared client is closed at exit)"""
         if self._session:
             self._session.close()
 
@@ -202,46 +422,340 @@ Consider:
         self.close()
 
 
-def main():
-    """Example usage"""
-    # Initialize client
-    client = MCPClient("http://10.0.0.209:8000")
-
-    # Check health
-    print("Checking MCP Server health...")
-    health = client.check_health()
-    print(f"Health Status: {health.get('data', {}).get('status', 'Unknown')}")
-    print()
-
-    # Test chat
-    print("Testing chat completion...")
-    response = client.chat("Hello! What can you help me with regarding crypto retirement?")
-    print(f"Response: {response.content}")
-    print()
-
-    # Portfolio analysis example
-    print("Portfolio Analysis:")
-    portfolio = {
-        "BTC": 2.5,
-        "ETH": 10,
-        "USDC": 5000
-    }
-    analysis = client.analyze_portfolio(portfolio)
-    print(analysis[:500])  # First 500 chars
-    print()
-
-    # Exit strategy example
-    print("Exit Strategy Recommendation:")
-    strategy = client.recommend_exit_strategy(
-        portfolio_value=250000,
-        retirement_goal=500000,
-        current_age=45,
-        retirement_age=65
-    )
-    print(strategy[:500])  # First 500 chars
+class AsyncMCPClient:
+    """
+    Async client for MCP (Model Control Protocol) Server
+    Issues chat completions concurrently so N requests cost ~1 round trip
+    """
+
+    def __init__(self, server_url: str = "http://10.0.0.209:8000"):
+        self.server_url = server_url
+        self.api_endpoint = f"{server_url}/v1/chat/completions"
+        self.health_endpoint = f"{server_url}/"
+        self._session: Optional[httpx.AsyncClient] = None
+        self.cache = ResponseCache()
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """Lazy async HTTP session with a keep-alive connection pool"""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20
+                )
+            )
+        return self._session
+
+    async def check_health(self) -> Dict:
+        """Check server health status"""
+        try:
+            response = await self.session.get(self.health_endpoint)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def chat(
+        self,
+        message: str,
+        model: str = "phi-3-local",
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        system: Optional[str] = None
+    ) -> ChatResponse:
+        """
+        Send chat completion request to MCP server (async)
+
+        Args:
+            message: User message
+            model: Model name (default: phi-3-local)
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+            system: Optional static system prompt (kept byte-identical
+                across calls to stay prefix-cache friendly)
+
+        Returns:
+            ChatResponse with AI-generated content
+        """
+        cache_text = f"{system}\n{message}" if system else message
+        cacheable = temperature <= _CACHE_MAX_TEMPERATURE
+        if cacheable:
+            cached = self.cache.get(cache_text, model, temperature)
+            if cached is not None:
+                return cached
+
+        payload = _build_chat_payload(message, model, temperature, max_tokens, system)
+
+        try:
+            response = await self.session.post(
+                self.api_endpoint,
+                content=payload,
+                headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+
+            result = _parse_chat_data(_json_loads(response.content), model)
+
+        except Exception as e:
+            return _error_response(e, model)
+
+        if cacheable and result.success:
+            self.cache.put(cache_text, model, temperature, result)
+        return result
+
+    async def chat_many(
+        self,
+        messages: List[str],
+        concurrency: int = 16,
+        **chat_kwargs
+    ) -> List[ChatResponse]:
+        """
+        Send many chat requests concurrently
+
+        Requests run in parallel, bounded by a semaphore so scenario sweeps
+        don't overwhelm the server.
+
+        Args:
+            messages: User messages, one request each
+            concurrency: Maximum in-flight requests
+            **chat_kwargs: Passed through to chat (model, temperature, ...)
+
+        Returns:
+            ChatResponses in the same order as messages
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(message: str) -> ChatResponse:
+            async with semaphore:
+                return await self.chat(message, **chat_kwargs)
+
+        return list(await asyncio.gather(*(bounded(m) for m in messages)))
+
+    async def chat_batched(self, message: str, **chat_kwargs) -> ChatResponse:
+        """
+        Send a chat request through the coalescing micro-batcher
+
+        Requests submitted within a short window (200ms, up to 8 at a time)
+        are collected by a background worker and issued as one concurrent
+        flight, so bursty callers share connections and scheduling overhead
+        instead of each paying a full round trip serially.
+
+        Args:
+            message: User message
+            **chat_kwargs: Passed through to chat (model, temperature, ...)
+
+        Returns:
+            ChatResponse, same as chat
+        """
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((message, chat_kwargs, future))
+        return await future
+
+    async def _batch_worker(self):
+        """Collect queued requests into micro-batches and dispatch them
+
+        Each batch starts with a blocking get, then drains further requests
+        until the window elapses or the batch is full. The batch is issued
+        as parallel per-prompt requests (the server's batched completion
+        mode can't be assumed); futures resolve in submission order.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW_SECONDS
+            while len(batch) < _MAX_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await asyncio.gather(
+                    *(self.chat(message, **kwargs) for message, kwargs, _ in batch),
+                    return_exceptions=True
+                )
+            except asyncio.CancelledError:
+                # Worker cancelled mid-batch: release the awaiters
+                for _, _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+            for (_, _, future), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def analyze_portfolio(
+        self,
+        portfolio: Dict[str, float],
+        market_conditions: Optional[Dict] = None
+    ) -> str:
+        """Ask MCP server to analyze portfolio (async)"""
+        prompt = _build_analyze_prompt(portfolio, market_conditions)
+        response = await self.chat(
+            prompt, temperature=0.3, max_tokens=800, system=_SYSTEM_PROMPT_ANALYZE
+        )
+        return response.content
+
+    async def recommend_exit_strategy(
+        self,
+        portfolio_value: float,
+        retirement_goal: float,
+        current_age: int,
+        retirement_age: int
+    ) -> str:
+        """Get AI-powered exit strategy recommendations (async)"""
+        prompt = _build_recommend_prompt(
+            portfolio_value, retirement_goal, current_age, retirement_age
+        )
+        response = await self.chat(
+            prompt, temperature=0.5, max_tokens=1000, system=_SYSTEM_PROMPT_RECOMMEND
+        )
+        return response.content
+
+    async def close(self):
+        """Stop the batch worker and close the HTTP session
+
+        Requests still queued or mid-batch get their futures cancelled,
+        so chat_batched awaiters are released instead of hanging.
+        """
+        if self._batch_task is not None:
+            task = self._batch_task
+            self._batch_task = None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            while not self._batch_queue.empty():
+                _, _, future = self._batch_queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+            self._batch_queue = None
+        if self._session:
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncAnalysisQueue:
+    """
+    Background queue for LLM portfolio commentary
+
+    The numeric tick path submits a portfolio and moves on; a worker task
+    drains the queue and runs analyze_portfolio on the async client, so a
+    slow LLM round trip never blocks signal generation. Results come back
+    through futures for callers that eventually want the commentary.
+    """
+
+    def __init__(self, client: "AsyncMCPClient"):
+        self.client = client
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(
+        self,
+        portfolio: Dict[str, float],
+        market_conditions: Optional[Dict] = None
+    ) -> "asyncio.Future":
+        """
+        Queue a portfolio for analysis without awaiting the result
+
+        Args:
+            portfolio: Dict of {asset: amount}
+            market_conditions: Optional market context
+
+        Returns:
+            Future resolving to the analysis text
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((portfolio, market_conditions, future))
+        return future
+
+    async def _worker(self):
+        """Drain queued portfolios one at a time through the client"""
+        while True:
+            portfolio, market_conditions, future = await self._queue.get()
+            try:
+                result = await self.client.analyze_portfolio(
+                    portfolio, market_conditions
+                )
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued analysis has completed"""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the worker task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+async def main():
+    """Example usage: the four demo requests run concurrently"""
+    async with AsyncMCPClient("http://10.0.0.209:8000") as client:
+        print("Querying MCP Server...")
+        health, response, analysis, strategy = await asyncio.gather(
+            client.check_health(),
+            client.chat("Hello! What can you help me with regarding crypto retirement?"),
+            client.analyze_portfolio({
+                "BTC": 2.5,
+                "ETH": 10,
+                "USDC": 5000
+            }),
+            client.recommend_exit_strategy(
+                portfolio_value=250000,
+                retirement_goal=500000,
+                current_age=45,
+                retirement_age=65
+            )
+        )
+
+        print(f"Health Status: {health.get('data', {}).get('status', 'Unknown')}")
+        print()
+
+        print(f"Chat Response: {response.content}")
+        print()
+
+        print("Portfolio Analysis:")
+        print(analysis[:500])  # First 500 chars
+        print()
 
-    client.close()
+        print("Exit Strategy Recommendation:")
+        print(strategy[:500])  # First 500 chars
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
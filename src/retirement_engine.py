@@ -6,7 +6,42 @@ Implements the Buffer-First, HIFO-Optimized withdrawal logic
 import json
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+# Long-term capital gains holding period
+_ONE_YEAR = timedelta(days=365)
+
+try:  # numba is optional; the NumPy path below is the fallback
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _hifo_cutoff_numpy(amounts: np.ndarray, price: float, target: float):
+    """Full-lot count and USD residual for a HIFO-ordered amounts array"""
+    cum_value = np.cumsum(amounts * price)
+    n_full = int(np.searchsorted(cum_value, target, side="right"))
+    residual = target - (cum_value[n_full - 1] if n_full else 0.0)
+    return n_full, residual
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _hifo_cutoff(amounts, price, target):  # pragma: no cover - needs numba
+        """JIT kernel: early-exit scan, no cumsum temporary"""
+        cum = 0.0
+        n_full = 0
+        for amount in amounts:
+            value = amount * price
+            if cum + value > target:
+                break
+            cum += value
+            n_full += 1
+        return n_full, target - cum
+else:
+    _hifo_cutoff = _hifo_cutoff_numpy
 
 
 @dataclass
@@ -45,6 +80,10 @@ class CryptoRetirementApp:
         self.buffer_target = monthly_need * 12 * buffer_years
         self.cash_buffer = current_cash
         self.tax_lots: List[TaxLot] = []
+        # SoA mirror of the lots so HIFO planning runs as array math
+        self._lot_amounts = np.empty(0)
+        self._lot_basis = np.empty(0)
+        self._lot_acq_dates = np.empty(0, dtype="datetime64[D]")
 
     def add_tax_lots(self, lots_data: List[Dict]) -> None:
         """Load tax lots from data"""
@@ -60,6 +99,30 @@ class CryptoRetirementApp:
             )
             for d in lots_data
         ]
+        # Keep lots in HIFO order (highest cost basis first) from the start:
+        # ingest is rare, planning is per-tick, so the sort is paid once here
+        self.tax_lots.sort(key=lambda lot: lot.cost_basis_per_unit, reverse=True)
+        self._refresh_lot_arrays()
+
+    def _refresh_lot_arrays(self) -> None:
+        """Rebuild the lot amount/basis/date arrays after the lots change"""
+        n = len(self.tax_lots)
+        self._lot_amounts = np.fromiter(
+            (lot.amount for lot in self.tax_lots), dtype=float, count=n
+        )
+        self._lot_basis = np.fromiter(
+            (lot.cost_basis_per_unit for lot in self.tax_lots), dtype=float, count=n
+        )
+        # Acquisition dates parsed once at ingest; malformed dates become NaT
+        # (classified short-term so they still surface a tax warning) instead
+        # of being silently strptime'd and swallowed on every check
+        dates = []
+        for lot in self.tax_lots:
+            try:
+                dates.append(np.datetime64(str(lot.date_acquired).split()[0], "D"))
+            except (ValueError, IndexError):
+                dates.append(np.datetime64("NaT", "D"))
+        self._lot_acq_dates = np.array(dates, dtype="datetime64[D]")
 
     def calculate_attack_strategy(
         self,
@@ -126,9 +189,12 @@ class CryptoRetirementApp:
                     self.cash_buffer += amount_needed
                     output["new_buffer"] = self.cash_buffer
 
-                    # Check for short-term capital gains warning
-                    for sale in sell_plan:
-                        if not self.is_long_term(sale.get("date_acquired", ""), current_date):
+                    # Check for short-term capital gains warning: one
+                    # vectorized date comparison covers every lot in the plan
+                    # (plan order matches the HIFO-sorted lot arrays)
+                    long_term = self.long_term_mask(current_date)
+                    for sale, is_lt in zip(sell_plan, long_term):
+                        if not is_lt:
                             output["warnings"].append(
                                 f"Short-Term Tax Warning: Lot {sale.get('lot_id')} "
                                 f"held <365 days. Consider tax impact."
@@ -158,33 +224,29 @@ class CryptoRetirementApp:
         if not self.tax_lots:
             return [{"lot_id": "manual", "asset": "BTC", "sell_amount": usd_target / current_price, "estimated_gain_loss": 0}]
 
-        # Sort by cost_basis_per_unit (Highest First - HIFO)
-        sorted_lots = sorted(self.tax_lots, key=lambda x: x.cost_basis_per_unit, reverse=True)
+        # Lots are already in HIFO order (sorted at ingest); the kernel scans
+        # the cumulative USD value for the cutoff between whole-lot sales and
+        # the single fractional sale covering the residual
+        n_full, residual_usd = _hifo_cutoff(
+            self._lot_amounts, float(current_price), float(usd_target)
+        )
 
         sell_plan = []
-        remaining_usd_needed = usd_target
-
-        for lot in sorted_lots:
-            if remaining_usd_needed <= 0:
-                break
-
-            lot_value_usd = lot.amount * current_price
-
-            if lot_value_usd <= remaining_usd_needed:
-                # Sell whole lot
-                sell_plan.append({
-                    "lot_id": lot.lot_id,
-                    "asset": lot.asset,
-                    "sell_amount": lot.amount,
-                    "cost_basis": lot.cost_basis_per_unit,
-                    "estimated_gain_loss": (current_price - lot.cost_basis_per_unit) * lot.amount,
-                    "date_acquired": lot.date_acquired,
-                    "location": lot.location
-                })
-                remaining_usd_needed -= lot_value_usd
-            else:
-                # Sell fraction of lot
-                fraction_to_sell = remaining_usd_needed / current_price
+        for lot in self.tax_lots[:n_full]:
+            sell_plan.append({
+                "lot_id": lot.lot_id,
+                "asset": lot.asset,
+                "sell_amount": lot.amount,
+                "cost_basis": lot.cost_basis_per_unit,
+                "estimated_gain_loss": (current_price - lot.cost_basis_per_unit) * lot.amount,
+                "date_acquired": lot.date_acquired,
+                "location": lot.location
+            })
+
+        if n_full < len(self.tax_lots):
+            if residual_usd > 0:
+                lot = self.tax_lots[n_full]
+                fraction_to_sell = residual_usd / current_price
                 sell_plan.append({
                     "lot_id": lot.lot_id,
                     "asset": lot.asset,
@@ -194,10 +256,27 @@ class CryptoRetirementApp:
                     "date_acquired": lot.date_acquired,
                     "location": lot.location
                 })
-                remaining_usd_needed = 0
 
         return sell_plan
 
+    def long_term_mask(self, current_date: Optional[datetime] = None) -> np.ndarray:
+        """
+        Long-term flags for every lot in one vectorized comparison
+
+        Args:
+            current_date: Current date (defaults to now)
+
+        Returns:
+            Boolean array aligned with tax_lots; True if held >365 days.
+            Lots with unparseable acquisition dates compare False (short
+            term) so they surface a warning instead of passing silently.
+        """
+        if current_date is None:
+            current_date = datetime.now()
+
+        cutoff = np.datetime64(current_date.date(), "D") - np.timedelta64(365, "D")
+        return self._lot_acq_dates <= cutoff
+
     def is_long_term(self, date_acquired: str, current_date: Optional[datetime] = None) -> bool:
         """
         Check if asset held for >1 year (long-term capital gains)
@@ -212,17 +291,19 @@ class CryptoRetirementApp:
         if current_date is None:
             current_date = datetime.now()
 
-        try:
-            if isinstance(date_acquired, str):
-                acquisition_date = datetime.strptime(date_acquired.split()[0], "%Y-%m-%d") if date_acquired else current_date
-            else:
-                acquisition_date = date_acquired
-
-            one_year_ago = current_date.replace(year=current_date.year - 1)
-
-            return acquisition_date <= one_year_ago
-        except:
-            return False
+        if isinstance(date_acquired, str):
+            try:
+                acquisition_date = date.fromisoformat(date_acquired[:10])
+            except ValueError:
+                return False
+        elif isinstance(date_acquired, datetime):
+            acquisition_date = date_acquired.date()
+        else:
+            acquisition_date = date_acquired
+
+        # timedelta subtraction instead of replace(year=...), which raised
+        # ValueError every Feb 29 and was silently swallowed
+        return acquisition_date <= current_date.date() - _ONE_YEAR
 
     def get_tax_efficiency_score(self) -> Dict:
         """
@@ -0,0 +1,118 @@
+"""
+Tests for the portfolio analyzer
+
+Fixture scoping: read-only inputs and the shared analysis are built once
+per module; tests that mutate state get a fresh Portfolio per function.
+"""
+
+import pytest
+
+from src.analyze_portfolio import AssetType, Portfolio, Holding, PortfolioAnalysis
+
+
+@pytest.fixture(scope="module")
+def sample_portfolio_data():
+    """Holding rows shared by every test in this module (read-only)"""
+    return [
+        {"asset": "BTC", "amount": 2.5, "avg_cost": 45000, "current_price": 65000},
+        {"asset": "ETH", "amount": 10, "avg_cost": 1550, "current_price": 2400},
+        {"asset": "USDC", "amount": 5000, "avg_cost": 1.0, "current_price": 1.0}
+    ]
+
+
+@pytest.fixture(scope="module")
+def analyzed_portfolio(sample_portfolio_data):
+    """One shared analysis; safe at module scope because no test mutates it"""
+    return Portfolio(sample_portfolio_data).analyze()
+
+
+@pytest.fixture
+def portfolio(sample_portfolio_data):
+    """Fresh Portfolio per test, for tests that update prices or holdings"""
+    return Portfolio(sample_portfolio_data)
+
+
+def test_portfolio_creation(portfolio):
+    assert len(portfolio.holdings) == 3
+    assert portfolio.total_value == pytest.approx(191500.0)
+    assert portfolio.total_cost == pytest.approx(133000.0)
+
+
+def test_portfolio_update_prices(portfolio):
+    portfolio.update_prices({"BTC": 70000, "ETH": 2500})
+    assert portfolio.total_value == pytest.approx(2.5 * 70000 + 10 * 2500 + 5000)
+
+
+def test_portfolio_add_holding(portfolio):
+    portfolio.add_holding(Holding("SOL", 100, 20, 25))
+    assert len(portfolio.holdings) == 4
+    assert portfolio.total_value == pytest.approx(191500.0 + 2500)
+
+
+def test_portfolio_analysis(analyzed_portfolio):
+    assert analyzed_portfolio.total_value == pytest.approx(191500.0)
+    assert analyzed_portfolio.total_cost == pytest.approx(133000.0)
+    assert analyzed_portfolio.unrealized_pnl == pytest.approx(58500.0)
+    assert analyzed_portfolio.top_holdings[0].asset == "BTC"
+
+
+def test_risk_calculation(analyzed_portfolio):
+    assert 0 <= analyzed_portfolio.risk_score <= 100
+    assert analyzed_portfolio.risk_score == pytest.approx(92.38)
+
+
+def test_diversification_score(analyzed_portfolio):
+    assert analyzed_portfolio.diversification_score == pytest.approx(26.36)
+
+
+def test_values_by_type(portfolio):
+    totals = portfolio.values_by_type()
+    assert totals[AssetType.BITCOIN.value] == pytest.approx(162500.0)
+    assert totals[AssetType.ETHEREUM.value] == pytest.approx(24000.0)
+    assert totals[AssetType.STABLECOIN.value] == pytest.approx(5000.0)
+    assert totals.sum() == pytest.approx(portfolio.total_value)
+
+
+def test_values_by_type_multi_position_type():
+    # Two LAYER1 positions must both count toward the type total
+    portfolio = Portfolio([
+        {"asset": "BTC", "amount": 1, "avg_cost": 90, "current_price": 100},
+        {"asset": "SOL", "amount": 1, "avg_cost": 10, "current_price": 10},
+        {"asset": "AVAX", "amount": 1, "avg_cost": 20, "current_price": 20}
+    ])
+    totals = portfolio.values_by_type()
+    assert totals[AssetType.LAYER1.value] == pytest.approx(30.0)
+    assert totals.sum() == pytest.approx(portfolio.total_value)
+
+
+def test_recommendations_generation(analyzed_portfolio):
+    recommendations = analyzed_portfolio.recommendations
+    assert any("BTC" in r for r in recommendations)
+    # the fixture holds USDC, so no stablecoin recommendation
+    assert not any("stablecoin" in r for r in recommendations)
+
+
+def test_empty_portfolio():
+    analysis = Portfolio().analyze()
+    assert analysis.total_value == 0
+    assert analysis.recommendations == (
+        "Portfolio is empty - add holdings to begin analysis",
+    )
+
+
+class TestHolding:
+    def test_cost_basis(self):
+        holding = Holding("BTC", 2.5, 45000, 50000)
+        assert holding.cost_basis == 112500
+
+    def test_pnl_calculation(self):
+        holding = Holding("BTC", 2.5, 45000, 50000)
+        assert holding.unrealized_pnl == 12500
+        assert round(holding.pnl_percentage, 2) == 11.11
+
+
+class TestPortfolioAnalysis:
+    def test_analysis_totals(self):
+        analysis = PortfolioAnalysis(total_value=225, total_cost=200)
+        assert analysis.unrealized_pnl == 25
+        assert analysis.pnl_percentage == pytest.approx(12.5)